@@ -3,6 +3,7 @@ from pathlib import Path
 from utils.file_handler import read_sales_data
 from utils.data_processor import (
     parse_transactions,
+    get_filter_options,
     validate_and_filter,
     calculate_total_revenue,
     region_wise_sales,
@@ -41,10 +42,9 @@ def main():
 
         # [3/10] Show filter options
         print("\n[3/10] Filter Options Available:")
-        regions = sorted({t["Region"] for t in transactions})
-        amounts = [t["Quantity"] * t["UnitPrice"] for t in transactions]
+        regions, lowest, highest = get_filter_options(transactions)
         print(f"Regions: {', '.join(regions)}")
-        print(f"Amount Range: ₹{min(amounts):,.0f} - ₹{max(amounts):,.0f}")
+        print(f"Amount Range: ₹{lowest:,.0f} - ₹{highest:,.0f}")
 
         choice = input("\nDo you want to filter data? (y/n): ").strip().lower()
 
@@ -73,8 +73,8 @@ def main():
         print("\n[5/10] Analyzing sales data...")
         calculate_total_revenue(valid_transactions)
         region_wise_sales(valid_transactions)
-        daily_sales_trend(valid_transactions)
-        find_peak_sales_day(valid_transactions)
+        daily = daily_sales_trend(valid_transactions)
+        find_peak_sales_day(valid_transactions, daily)
         top_selling_products(valid_transactions)
         low_performing_products(valid_transactions)
         customer_analysis(valid_transactions)
@@ -1,87 +1,211 @@
 # Optional API handler placeholder
+import json
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils.file_handler import ensure_dir, write_text
 
 BASE_URL = "https://dummyjson.com/products"
+PRODUCT_FIELDS = ("id", "title", "category", "brand", "price", "rating")
+PAGE_SIZE = 100
+MAX_WORKERS = 4
+CACHE_FILE = Path("data/.cache/products.json")
+
+# Shared session so repeated calls reuse the same pooled connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+
+def _request_page(skip, headers=None):
+    """
+    Requests one page of products starting at the given offset.
+    Returns the raw response (may be 304 for conditional requests).
+    """
+    response = _SESSION.get(
+        BASE_URL,
+        params={"limit": PAGE_SIZE, "skip": skip},
+        headers=headers,
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response
+
+
+def _fetch_page(skip, cached=None):
+    """
+    Fetches one page of products, revalidating a cached copy if given.
+    Returns page dictionary: {"etag", "total", "products"}.
+    """
+    response = _request_page(skip, _conditional_headers(cached))
+    if response.status_code == 304 and cached is not None:
+        return cached
+
+    data = response.json()
+    return {
+        "etag": response.headers.get("ETag"),
+        "total": data.get("total", 0),
+        "products": [
+            {field: p.get(field) for field in PRODUCT_FIELDS}
+            for p in data.get("products", [])
+        ],
+    }
+
+
+def _load_cache():
+    """
+    Loads the cached product pages saved by a previous run.
+    Returns dictionary mapping page offset to page, or None if missing,
+    unreadable or malformed.
+    """
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    pages = cache.get("pages") if isinstance(cache, dict) else None
+    if not isinstance(pages, dict) or not all(
+        isinstance(page, dict) and isinstance(page.get("products"), list)
+        for page in pages.values()
+    ):
+        return None
+    return pages
+
+
+def _cached_products(pages):
+    """
+    Flattens cached pages into one product list in offset order.
+    Returns list of product dictionaries.
+    """
+    return [
+        p
+        for skip in sorted(pages, key=int)
+        for p in pages[skip]["products"]
+    ]
+
+
+def _save_cache(pages):
+    """
+    Saves fetched pages to disk for conditional requests on later runs.
+    """
+    ensure_dir(CACHE_FILE.parent)
+    write_text(CACHE_FILE, json.dumps({"pages": pages}))
+
+
+def _conditional_headers(cached):
+    """
+    Builds validators for a conditional GET from a cached page.
+    Returns dictionary of request headers.
+    """
+    if cached is None:
+        return {}
+
+    headers = {
+        "If-Modified-Since": formatdate(CACHE_FILE.stat().st_mtime, usegmt=True)
+    }
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    return headers
 
 
 def fetch_all_products():
     """
     Fetches all products from DummyJSON API.
+    Every page is a conditional request against its own cached copy, so
+    unchanged pages are reused and changed ones refreshed. The first page
+    reports the catalog size; remaining pages are requested concurrently.
+    If the API cannot be reached, the cached products are returned instead.
     Returns list of product dictionaries.
     """
+    cache = _load_cache()
+    cached_pages = cache or {}
+
+    def fetch(skip):
+        return _fetch_page(skip, cached_pages.get(str(skip)))
+
     try:
-        response = requests.get(f"{BASE_URL}?limit=100", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        products = []
-        for p in data.get("products", []):
-            products.append({
-                "id": p.get("id"),
-                "title": p.get("title"),
-                "category": p.get("category"),
-                "brand": p.get("brand"),
-                "price": p.get("price"),
-                "rating": p.get("rating"),
-            })
+        first = fetch(0)
+        offsets = range(0, first.get("total", 0), PAGE_SIZE)
+        pages = [first]
 
-        print("API fetch successful")
-        return products
+        if len(offsets) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                pages.extend(executor.map(fetch, offsets[1:]))
 
     except Exception as e:
         print(f"API fetch failed: {e}")
+        if cache is not None:
+            print("Using cached products from a previous run")
+            return _cached_products(cache)
         return []
 
+    products = [p for page in pages for p in page["products"]]
+
+    # A cache that cannot be written must not discard a successful fetch
+    try:
+        _save_cache({str(skip): page for skip, page in zip(offsets, pages)})
+    except OSError as e:
+        print(f"Warning: could not write product cache: {e}")
+
+    print("API fetch successful")
+    return products
+
 
 def create_product_mapping(api_products):
     """
     Creates mapping of product ID to product info.
     Returns dictionary mapping product IDs to info.
     """
-    mapping = {}
-
-    for p in api_products:
-        pid = p.get("id")
-        if pid is not None:
-            mapping[pid] = {
-                "title": p.get("title"),
-                "category": p.get("category"),
-                "brand": p.get("brand"),
-                "rating": p.get("rating"),
-            }
-
-    return mapping
+    return {
+        p["id"]: {
+            "title": p.get("title"),
+            "category": p.get("category"),
+            "brand": p.get("brand"),
+            "rating": p.get("rating"),
+        }
+        for p in api_products
+        if p.get("id") is not None
+    }
 
 
 def enrich_sales_data(transactions, product_mapping):
     """
     Enriches transactions with API product data.
+    Matches on the ProductNum set by parse_transactions, deriving it from
+    ProductID for records built elsewhere.
     Returns list of enriched transaction dictionaries.
     """
+    no_match = {
+        "API_Category": None,
+        "API_Brand": None,
+        "API_Rating": None,
+        "API_Match": False,
+    }
     enriched = []
+    append = enriched.append
 
     for t in transactions:
-        record = t.copy()
-
-        # Extract numeric product ID (P101 -> 101)
-        try:
-            numeric_id = int(t["ProductID"][1:])
-        except Exception:
-            numeric_id = None
-
-        if numeric_id in product_mapping:
-            api_info = product_mapping[numeric_id]
-            record["API_Category"] = api_info["category"]
-            record["API_Brand"] = api_info["brand"]
-            record["API_Rating"] = api_info["rating"]
-            record["API_Match"] = True
+        product_num = t.get("ProductNum")
+        if product_num is None:
+            # Extract numeric product ID (P101 -> 101)
+            digits = t["ProductID"][1:]
+            product_num = int(digits) if digits.isdecimal() else None
+
+        # One lookup, and the record is built in a single dict display
+        api_info = product_mapping.get(product_num)
+        if api_info is None:
+            append({**t, **no_match})
         else:
-            record["API_Category"] = None
-            record["API_Brand"] = None
-            record["API_Rating"] = None
-            record["API_Match"] = False
-
-        enriched.append(record)
+            append({
+                **t,
+                "API_Category": api_info["category"],
+                "API_Brand": api_info["brand"],
+                "API_Rating": api_info["rating"],
+                "API_Match": True,
+            })
 
     return enriched
 
@@ -1,54 +1,66 @@
+import heapq
+import io
+from collections import defaultdict
 from dataclasses import dataclass
+from datetime import datetime
+from sys import intern
 
-@dataclass
+from utils.file_handler import write_text
+
+@dataclass(frozen=True)
 class SaleRecord:
+    # Explicit slots (dataclass(slots=True) needs 3.10) drop the per-instance __dict__
+    __slots__ = (
+        "transaction_id", "date", "product_id", "product_name",
+        "quantity", "unit_price", "customer_id", "region", "revenue",
+    )
+
     transaction_id: str
     date: str
     product_id: str
     product_name: str
     quantity: int
-    unit_price: int
+    unit_price: float
     customer_id: str
     region: str
 
-    @property
-    def revenue(self):
-        return self.quantity * self.unit_price
+    def __post_init__(self):
+        # Derived slot (not a dataclass field): computed once, not per access.
+        # Frozen so it cannot go stale; the price is a slightly slower
+        # __init__, since frozen dataclasses assign via object.__setattr__.
+        object.__setattr__(self, "revenue", self.quantity * self.unit_price)
 
-def _to_int(v):
-    try:
-        return int(v.replace(",", ""))
-    except:
-        return None
+    # copy/deepcopy/pickle restore slots with setattr, which frozen blocks;
+    # mirror what dataclass(slots=True, frozen=True) generates on 3.10+
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 def parse_and_clean(lines):
-    total = invalid = 0
-    cleaned = []
-    for line in lines[1:]:
-        total += 1
-        parts = line.split("|")
-        if len(parts) != 8:
-            invalid += 1
-            continue
-        tid, d, pid, pname, q, p, cid, r = parts
-        if not tid.startswith("T") or not cid or not r:
-            invalid += 1
-            continue
-        q = _to_int(q)
-        p = _to_int(p)
-        if not q or not p or q <= 0 or p <= 0:
-            invalid += 1
-            continue
-        cleaned.append(SaleRecord(tid, d, pid, pname.replace(",", ""), q, p, cid, r))
-    return cleaned, total, invalid, len(cleaned)
+    # SaleRecord adapter over the canonical parse + validation rules
+    rows = lines[1:]
+    cleaned = [
+        SaleRecord(
+            t["TransactionID"], t["Date"], t["ProductID"], t["ProductName"],
+            t["Quantity"], t["UnitPrice"], t["CustomerID"], t["Region"],
+        )
+        for t in parse_transactions(rows)
+        if _is_valid(t)
+    ]
+    return cleaned, len(rows), len(rows) - len(cleaned), len(cleaned)
 
 def compute_metrics(records):
-    total_rev = sum(r.revenue for r in records)
-    by_product = {}
-    by_region = {}
+    total_rev = 0
+    by_product = defaultdict(int)
+    by_region = defaultdict(int)
     for r in records:
-        by_product[r.product_name] = by_product.get(r.product_name, 0) + r.revenue
-        by_region[r.region] = by_region.get(r.region, 0) + r.revenue
+        rev = r.revenue
+        total_rev += rev
+        by_product[r.product_name] += rev
+        by_region[r.region] += rev
     top_product = max(by_product.items(), key=lambda x: x[1])
     regions = sorted(by_region.items(), key=lambda x: x[1], reverse=True)
     return {
@@ -58,9 +70,14 @@ def compute_metrics(records):
     }
 def parse_transactions(raw_lines):
     """
-    Parses raw lines into clean list of dictionaries
+    Parses raw lines into clean list of dictionaries.
+    Each record carries its precomputed Amount (Quantity * UnitPrice)
+    and ProductNum (numeric product ID used for API enrichment).
+    Downstream helpers fall back to Quantity * UnitPrice when Amount is
+    absent, so dicts built elsewhere still work.
     """
     transactions = []
+    append = transactions.append
 
     for line in raw_lines:
         parts = line.split("|")
@@ -69,57 +86,95 @@ def parse_transactions(raw_lines):
 
         tid, date, pid, pname, qty, price, cid, region = parts
 
-        pname = pname.replace(",", "").strip()
-
         try:
             quantity = int(qty.replace(",", ""))
             unit_price = float(price.replace(",", ""))
         except ValueError:
             continue
 
-        transactions.append({
+        # Repeated grouping keys share one string object across all rows
+        pname = intern(pname.replace(",", "").strip())
+
+        # Numeric part of the product ID (P101 -> 101), -1 when malformed
+        pid = pid.strip()
+        digits = pid[1:]
+        product_num = int(digits) if digits.isdecimal() else -1
+
+        append({
             "TransactionID": tid.strip(),
-            "Date": date.strip(),
-            "ProductID": pid.strip(),
+            "Date": intern(date.strip()),
+            "ProductID": pid,
+            "ProductNum": product_num,
             "ProductName": pname,
             "Quantity": quantity,
             "UnitPrice": unit_price,
-            "CustomerID": cid.strip(),
-            "Region": region.strip()
+            "Amount": quantity * unit_price,
+            "CustomerID": intern(cid.strip()),
+            "Region": intern(region.strip())
         })
 
     return transactions
 
+def get_filter_options(transactions):
+    """
+    Collects the filter choices shown to the user in a single pass.
+    Returns: (sorted_regions, min_amount, max_amount)
+    """
+    regions = set()
+    low = high = None
+
+    for t in transactions:
+        regions.add(t["Region"])
+        amount = t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+        if low is None or amount < low:
+            low = amount
+        if high is None or amount > high:
+            high = amount
+
+    return sorted(regions), low or 0.0, high or 0.0
+
+def _is_valid(t):
+    """
+    Applies the record-level validity rules shared by every entry point.
+    Returns: bool
+    """
+    return (
+        t["Quantity"] > 0 and
+        t["UnitPrice"] > 0 and
+        t["TransactionID"].startswith("T") and
+        t["ProductID"].startswith("P") and
+        t["CustomerID"].startswith("C") and
+        bool(t["Region"])
+    )
+
 def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
     """
     Validates transactions and applies optional filters.
     Returns: (valid_transactions, invalid_count, summary)
     """
     valid = []
+    append = valid.append
     invalid_count = 0
 
+    # Decide once which optional filters are active instead of per row
+    filter_amount = bool(min_amount or max_amount)
+
     for t in transactions:
-        if (
-            t["Quantity"] <= 0 or
-            t["UnitPrice"] <= 0 or
-            not t["TransactionID"].startswith("T") or
-            not t["ProductID"].startswith("P") or
-            not t["CustomerID"].startswith("C") or
-            not t["Region"]
-        ):
+        if not _is_valid(t):
             invalid_count += 1
             continue
 
-        amount = t["Quantity"] * t["UnitPrice"]
-
         if region and t["Region"] != region:
             continue
-        if min_amount and amount < min_amount:
-            continue
-        if max_amount and amount > max_amount:
-            continue
 
-        valid.append(t)
+        if filter_amount:
+            amount = t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+            if min_amount and amount < min_amount:
+                continue
+            if max_amount and amount > max_amount:
+                continue
+
+        append(t)
 
     summary = {
         "total_input": len(transactions),
@@ -142,32 +197,31 @@ def calculate_total_revenue(transactions):
     Calculates total revenue from all transactions.
     Returns: float
     """
-    total = 0.0
-    for t in transactions:
-        total += t["Quantity"] * t["UnitPrice"]
-    return total
+    return sum(
+        (t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+         for t in transactions),
+        0.0,
+    )
 
 def region_wise_sales(transactions):
     """
     Aggregates sales by region.
     Returns dictionary with region statistics.
     """
-    region_stats = {}
-
-    total_revenue = calculate_total_revenue(transactions)
+    region_stats = defaultdict(lambda: {
+        "total_sales": 0.0,
+        "transactions": 0
+    })
+    total_revenue = 0.0
 
+    # Accumulate the grand total in the same pass instead of a second scan
     for t in transactions:
-        region = t["Region"]
-        amount = t["Quantity"] * t["UnitPrice"]
+        amount = t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+        total_revenue += amount
 
-        if region not in region_stats:
-            region_stats[region] = {
-                "total_sales": 0.0,
-                "transactions": 0
-            }
-
-        region_stats[region]["total_sales"] += amount
-        region_stats[region]["transactions"] += 1
+        stats = region_stats[t["Region"]]
+        stats["total_sales"] += amount
+        stats["transactions"] += 1
 
     # Add percentage + sort
     for region in region_stats:
@@ -189,108 +243,78 @@ def daily_sales_trend(transactions):
     Analyzes sales trends by date.
     Returns dictionary sorted by date.
     """
-    daily = {}
+    daily = defaultdict(lambda: {
+        "revenue": 0.0,
+        "transaction_count": 0,
+        "unique_customers": set()
+    })
 
     for t in transactions:
-        date = t["Date"]
-        amount = t["Quantity"] * t["UnitPrice"]
-
-        if date not in daily:
-            daily[date] = {
-                "revenue": 0.0,
-                "transaction_count": 0,
-                "unique_customers": set()
-            }
-
-        daily[date]["revenue"] += amount
-        daily[date]["transaction_count"] += 1
-        daily[date]["unique_customers"].add(t["CustomerID"])
+        day = daily[t["Date"]]
+        day["revenue"] += t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+        day["transaction_count"] += 1
+        day["unique_customers"].add(t["CustomerID"])
 
     # Convert set to count
-    for d in daily:
-        daily[d]["unique_customers"] = len(daily[d]["unique_customers"])
+    for day in daily.values():
+        day["unique_customers"] = len(day["unique_customers"])
 
     return dict(sorted(daily.items()))
 
-def find_peak_sales_day(transactions):
+def find_peak_sales_day(transactions, daily=None):
     """
-    Identifies the date with highest revenue.
+    Identifies the date with highest revenue; ties go to the earliest date.
+    Reuses a precomputed daily_sales_trend result when one is passed in.
     Returns tuple: (date, revenue, transaction_count)
     """
-    daily = {}
-
-    for t in transactions:
-        date = t["Date"]
-        amount = t["Quantity"] * t["UnitPrice"]
-
-        if date not in daily:
-            daily[date] = {
-                "revenue": 0.0,
-                "count": 0
-            }
-
-        daily[date]["revenue"] += amount
-        daily[date]["count"] += 1
+    if daily is None:
+        # Revenue and count only; no per-day customer sets are needed here
+        daily = defaultdict(lambda: {
+            "revenue": 0.0,
+            "transaction_count": 0
+        })
+        for t in transactions:
+            day = daily[t["Date"]]
+            day["revenue"] += t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+            day["transaction_count"] += 1
 
-    peak_date = max(daily.items(), key=lambda x: x[1]["revenue"])
-    return peak_date[0], peak_date[1]["revenue"], peak_date[1]["count"]
+    # max() keeps the first maximum, so scanning in date order settles ties
+    peak_date = max(sorted(daily.items()), key=lambda x: x[1]["revenue"])
+    return peak_date[0], peak_date[1]["revenue"], peak_date[1]["transaction_count"]
 
-def top_selling_products(transactions, n=5):
+def _product_totals(transactions):
     """
-    Finds top n products by total quantity sold.
-    Returns list of tuples.
+    Aggregates quantity sold and revenue per product in one pass.
+    Returns list of tuples: (product_name, total_qty, total_revenue)
     """
-    products = {}
+    products = defaultdict(lambda: {
+        "qty": 0,
+        "revenue": 0.0
+    })
 
     for t in transactions:
-        name = t["ProductName"]
-        qty = t["Quantity"]
-        revenue = t["Quantity"] * t["UnitPrice"]
-
-        if name not in products:
-            products[name] = {
-                "qty": 0,
-                "revenue": 0.0
-            }
-
-        products[name]["qty"] += qty
-        products[name]["revenue"] += revenue
+        product = products[t["ProductName"]]
+        product["qty"] += t["Quantity"]
+        product["revenue"] += t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
 
-    result = [
+    return [
         (name, v["qty"], v["revenue"])
         for name, v in products.items()
     ]
 
-    result.sort(key=lambda x: x[1], reverse=True)
-    return result[:n]
+def top_selling_products(transactions, n=5):
+    """
+    Finds top n products by total quantity sold.
+    Returns list of tuples.
+    """
+    return heapq.nlargest(n, _product_totals(transactions), key=lambda x: x[1])
 
 def low_performing_products(transactions, threshold=10):
     """
     Identifies products with low total quantity sold.
     Returns list of tuples.
     """
-    products = {}
-
-    for t in transactions:
-        name = t["ProductName"]
-        qty = t["Quantity"]
-        revenue = t["Quantity"] * t["UnitPrice"]
-
-        if name not in products:
-            products[name] = {
-                "qty": 0,
-                "revenue": 0.0
-            }
-
-        products[name]["qty"] += qty
-        products[name]["revenue"] += revenue
-
-    result = [
-        (name, v["qty"], v["revenue"])
-        for name, v in products.items()
-        if v["qty"] < threshold
-    ]
-
+    result = [p for p in _product_totals(transactions) if p[1] < threshold]
     result.sort(key=lambda x: x[1])
     return result
 
@@ -299,34 +323,26 @@ def customer_analysis(transactions):
     Analyzes customer purchase patterns.
     Returns dictionary of customer statistics.
     """
-    customers = {}
+    customers = defaultdict(lambda: {
+        "total_spent": 0.0,
+        "purchase_count": 0,
+        "products": set()
+    })
 
     for t in transactions:
-        cid = t["CustomerID"]
-        amount = t["Quantity"] * t["UnitPrice"]
-
-        if cid not in customers:
-            customers[cid] = {
-                "total_spent": 0.0,
-                "purchase_count": 0,
-                "products": set()
-            }
-
-        customers[cid]["total_spent"] += amount
-        customers[cid]["purchase_count"] += 1
-        customers[cid]["products"].add(t["ProductName"])
+        stats = customers[t["CustomerID"]]
+        stats["total_spent"] += t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+        stats["purchase_count"] += 1
+        stats["products"].add(t["ProductName"])
 
     # Final formatting
-    for cid in customers:
-        customers[cid]["average_order_value"] = (
-            customers[cid]["total_spent"] / customers[cid]["purchase_count"]
+    for stats in customers.values():
+        stats["average_order_value"] = (
+            stats["total_spent"] / stats["purchase_count"]
         )
-        customers[cid]["products_bought"] = list(customers[cid]["products"])
-        del customers[cid]["products"]
-
-    return customers
+        stats["products_bought"] = list(stats.pop("products"))
 
-    from datetime import datetime
+    return dict(customers)
 
 
 def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
@@ -341,79 +357,72 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
     total_records = len(transactions)
 
     # -----------------------------
-    # OVERALL SUMMARY
+    # SINGLE PASS AGGREGATION
     # -----------------------------
-    total_revenue = sum(t["Quantity"] * t["UnitPrice"] for t in transactions)
-    avg_order_value = total_revenue / total_records if total_records else 0
-
-    dates = [t["Date"] for t in transactions]
-    date_range = f"{min(dates)} to {max(dates)}" if dates else "N/A"
+    total_revenue = 0
+    region_stats = defaultdict(lambda: {"sales": 0, "count": 0})
+    products = defaultdict(lambda: {"qty": 0, "rev": 0})
+    customers = defaultdict(lambda: {"spent": 0, "count": 0})
+    daily = defaultdict(lambda: {"rev": 0, "count": 0, "customers": set()})
 
-    # -----------------------------
-    # REGION-WISE PERFORMANCE
-    # -----------------------------
-    region_stats = {}
     for t in transactions:
-        region = t["Region"]
-        amount = t["Quantity"] * t["UnitPrice"]
-        if region not in region_stats:
-            region_stats[region] = {"sales": 0, "count": 0}
-        region_stats[region]["sales"] += amount
-        region_stats[region]["count"] += 1
+        amt = t["Amount"] if "Amount" in t else t["Quantity"] * t["UnitPrice"]
+        cid = t["CustomerID"]
+        total_revenue += amt
 
-    for r in region_stats:
-        region_stats[r]["percentage"] = (region_stats[r]["sales"] / total_revenue) * 100 if total_revenue else 0
+        region = region_stats[t["Region"]]
+        region["sales"] += amt
+        region["count"] += 1
 
-    region_sorted = sorted(region_stats.items(), key=lambda x: x[1]["sales"], reverse=True)
+        product = products[t["ProductName"]]
+        product["qty"] += t["Quantity"]
+        product["rev"] += amt
+
+        customer = customers[cid]
+        customer["spent"] += amt
+        customer["count"] += 1
+
+        day = daily[t["Date"]]
+        day["rev"] += amt
+        day["count"] += 1
+        day["customers"].add(cid)
+
+    # Collapse per-day customer sets to counts now that the pass is done
+    for day in daily.values():
+        day["customers"] = len(day["customers"])
 
     # -----------------------------
-    # TOP 5 PRODUCTS
+    # OVERALL SUMMARY
     # -----------------------------
-    products = {}
-    for t in transactions:
-        name = t["ProductName"]
-        qty = t["Quantity"]
-        rev = t["Quantity"] * t["UnitPrice"]
-        if name not in products:
-            products[name] = {"qty": 0, "rev": 0}
-        products[name]["qty"] += qty
-        products[name]["rev"] += rev
+    avg_order_value = total_revenue / total_records if total_records else 0
 
-    top_products = sorted(products.items(), key=lambda x: x[1]["qty"], reverse=True)[:5]
+    # Dates are ISO strings, so the unique daily keys give the range directly
+    date_range = f"{min(daily)} to {max(daily)}" if daily else "N/A"
 
     # -----------------------------
-    # TOP 5 CUSTOMERS
+    # REGION-WISE PERFORMANCE
     # -----------------------------
-    customers = {}
-    for t in transactions:
-        cid = t["CustomerID"]
-        amt = t["Quantity"] * t["UnitPrice"]
-        if cid not in customers:
-            customers[cid] = {"spent": 0, "count": 0}
-        customers[cid]["spent"] += amt
-        customers[cid]["count"] += 1
+    for v in region_stats.values():
+        v["percentage"] = (v["sales"] / total_revenue) * 100 if total_revenue else 0
 
-    top_customers = sorted(customers.items(), key=lambda x: x[1]["spent"], reverse=True)[:5]
+    region_sorted = sorted(region_stats.items(), key=lambda x: x[1]["sales"], reverse=True)
 
     # -----------------------------
-    # DAILY SALES TREND
+    # TOP 5 PRODUCTS / CUSTOMERS
     # -----------------------------
-    daily = {}
-    for t in transactions:
-        d = t["Date"]
-        amt = t["Quantity"] * t["UnitPrice"]
-        if d not in daily:
-            daily[d] = {"rev": 0, "count": 0, "customers": set()}
-        daily[d]["rev"] += amt
-        daily[d]["count"] += 1
-        daily[d]["customers"].add(t["CustomerID"])
+    top_products = heapq.nlargest(5, products.items(), key=lambda x: x[1]["qty"])
+    top_customers = heapq.nlargest(5, customers.items(), key=lambda x: x[1]["spent"])
 
+    # -----------------------------
+    # DAILY SALES TREND
+    # -----------------------------
     daily_sorted = sorted(daily.items())
 
     # -----------------------------
     # PRODUCT PERFORMANCE ANALYSIS
     # -----------------------------
-    best_day = max(daily.items(), key=lambda x: x[1]["rev"])
+    # Same tie rule as find_peak_sales_day: earliest date wins
+    best_day = max(daily_sorted, key=lambda x: x[1]["rev"])
     low_products = [name for name, v in products.items() if v["qty"] < 10]
 
     avg_txn_region = {
@@ -423,72 +432,84 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
     # -----------------------------
     # API ENRICHMENT SUMMARY
     # -----------------------------
-    enriched_count = sum(1 for t in enriched_transactions if t.get("API_Match"))
-    success_rate = (enriched_count / len(enriched_transactions)) * 100 if enriched_transactions else 0
+    enriched_count = 0
+    not_enriched_set = set()
+    for t in enriched_transactions:
+        if t.get("API_Match"):
+            enriched_count += 1
+        else:
+            not_enriched_set.add(t["ProductName"])
 
-    not_enriched = sorted(
-        {t["ProductName"] for t in enriched_transactions if not t.get("API_Match")}
-    )
+    success_rate = (enriched_count / len(enriched_transactions)) * 100 if enriched_transactions else 0
+    not_enriched = sorted(not_enriched_set)
 
     # -----------------------------
     # WRITE REPORT
     # -----------------------------
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("=" * 45 + "\n")
-        f.write("SALES ANALYTICS REPORT\n")
-        f.write(f"Generated: {now}\n")
-        f.write(f"Records Processed: {total_records}\n")
-        f.write("=" * 45 + "\n\n")
-
-        f.write("OVERALL SUMMARY\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"Total Revenue: ₹{money(total_revenue)}\n")
-        f.write(f"Total Transactions: {total_records}\n")
-        f.write(f"Average Order Value: ₹{money(avg_order_value)}\n")
-        f.write(f"Date Range: {date_range}\n\n")
-
-        f.write("REGION-WISE PERFORMANCE\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"{'Region':<10}{'Sales':>15}{'% of Total':>15}{'Transactions':>15}\n")
-        for r, v in region_sorted:
-            f.write(f"{r:<10}₹{money(v['sales']):>14}{v['percentage']:>14.2f}%{v['count']:>15}\n")
-        f.write("\n")
-
-        f.write("TOP 5 PRODUCTS\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"{'Rank':<6}{'Product':<25}{'Qty Sold':>10}{'Revenue':>15}\n")
-        for i, (name, v) in enumerate(top_products, 1):
-            f.write(f"{i:<6}{name:<25}{v['qty']:>10}₹{money(v['rev']):>14}\n")
-        f.write("\n")
-
-        f.write("TOP 5 CUSTOMERS\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"{'Rank':<6}{'Customer ID':<15}{'Total Spent':>15}{'Orders':>10}\n")
-        for i, (cid, v) in enumerate(top_customers, 1):
-            f.write(f"{i:<6}{cid:<15}₹{money(v['spent']):>14}{v['count']:>10}\n")
-        f.write("\n")
-
-        f.write("DAILY SALES TREND\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"{'Date':<12}{'Revenue':>15}{'Transactions':>15}{'Customers':>15}\n")
-        for d, v in daily_sorted:
-            f.write(f"{d:<12}₹{money(v['rev']):>14}{v['count']:>15}{len(v['customers']):>15}\n")
-        f.write("\n")
-
-        f.write("PRODUCT PERFORMANCE ANALYSIS\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"Best Selling Day: {best_day[0]} (₹{money(best_day[1]['rev'])})\n")
-        f.write(f"Low Performing Products: {', '.join(low_products) if low_products else 'None'}\n")
-        f.write("Average Transaction Value per Region:\n")
-        for r, avg in avg_txn_region.items():
-            f.write(f"- {r}: ₹{money(avg)}\n")
-        f.write("\n")
-
-        f.write("API ENRICHMENT SUMMARY\n")
-        f.write("-" * 45 + "\n")
-        f.write(f"Total Products Enriched: {enriched_count}\n")
-        f.write(f"Success Rate: {success_rate:.2f}%\n")
-        f.write("Products Not Enriched:\n")
-        for p in not_enriched:
-            f.write(f"- {p}\n")
-
+    # Bind write once; table rows use pre-bound str.format templates
+    buf = io.StringIO()
+    w = buf.write
+
+    w("=" * 45 + "\n")
+    w("SALES ANALYTICS REPORT\n")
+    w(f"Generated: {now}\n")
+    w(f"Records Processed: {total_records}\n")
+    w("=" * 45 + "\n\n")
+
+    w("OVERALL SUMMARY\n")
+    w("-" * 45 + "\n")
+    w(f"Total Revenue: ₹{money(total_revenue)}\n")
+    w(f"Total Transactions: {total_records}\n")
+    w(f"Average Order Value: ₹{money(avg_order_value)}\n")
+    w(f"Date Range: {date_range}\n\n")
+
+    w("REGION-WISE PERFORMANCE\n")
+    w("-" * 45 + "\n")
+    w(f"{'Region':<10}{'Sales':>15}{'% of Total':>15}{'Transactions':>15}\n")
+    row = "{:<10}₹{:>14}{:>14.2f}%{:>15}\n".format
+    for r, v in region_sorted:
+        w(row(r, money(v["sales"]), v["percentage"], v["count"]))
+    w("\n")
+
+    w("TOP 5 PRODUCTS\n")
+    w("-" * 45 + "\n")
+    w(f"{'Rank':<6}{'Product':<25}{'Qty Sold':>10}{'Revenue':>15}\n")
+    row = "{:<6}{:<25}{:>10}₹{:>14}\n".format
+    for i, (name, v) in enumerate(top_products, 1):
+        w(row(i, name, v["qty"], money(v["rev"])))
+    w("\n")
+
+    w("TOP 5 CUSTOMERS\n")
+    w("-" * 45 + "\n")
+    w(f"{'Rank':<6}{'Customer ID':<15}{'Total Spent':>15}{'Orders':>10}\n")
+    row = "{:<6}{:<15}₹{:>14}{:>10}\n".format
+    for i, (cid, v) in enumerate(top_customers, 1):
+        w(row(i, cid, money(v["spent"]), v["count"]))
+    w("\n")
+
+    w("DAILY SALES TREND\n")
+    w("-" * 45 + "\n")
+    w(f"{'Date':<12}{'Revenue':>15}{'Transactions':>15}{'Customers':>15}\n")
+    row = "{:<12}₹{:>14}{:>15}{:>15}\n".format
+    for d, v in daily_sorted:
+        w(row(d, money(v["rev"]), v["count"], v["customers"]))
+    w("\n")
+
+    w("PRODUCT PERFORMANCE ANALYSIS\n")
+    w("-" * 45 + "\n")
+    w(f"Best Selling Day: {best_day[0]} (₹{money(best_day[1]['rev'])})\n")
+    w(f"Low Performing Products: {', '.join(low_products) if low_products else 'None'}\n")
+    w("Average Transaction Value per Region:\n")
+    for r, avg in avg_txn_region.items():
+        w(f"- {r}: ₹{money(avg)}\n")
+    w("\n")
+
+    w("API ENRICHMENT SUMMARY\n")
+    w("-" * 45 + "\n")
+    w(f"Total Products Enriched: {enriched_count}\n")
+    w(f"Success Rate: {success_rate:.2f}%\n")
+    w("Products Not Enriched:\n")
+    for p in not_enriched:
+        w(f"- {p}\n")
+
+    write_text(output_file, buf.getvalue())
@@ -1,3 +1,5 @@
+import codecs
+import io
 from pathlib import Path
 
 def read_text_lines(file_path):
@@ -16,17 +18,33 @@ def read_sales_data(filename):
     Reads sales data from file handling encoding issues.
     Returns: list of raw lines (strings), excluding header
     """
-    encodings = ["utf-8", "latin-1", "cp1252"]
+    # latin-1 decodes any byte sequence, so it must be the last resort
+    encodings = ["utf-8", "cp1252", "latin-1"]
+
+    # Read the file once and retry decoding on the in-memory bytes
+    try:
+        data = Path(filename).read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+
+    # A byte-order mark identifies the encoding without trial decoding
+    if data.startswith(codecs.BOM_UTF8):
+        encodings = ["utf-8-sig"]
+    elif data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encodings = ["utf-16"]
 
     for enc in encodings:
         try:
-            with open(filename, "r", encoding=enc) as f:
-                lines = f.readlines()
-                return [line.strip() for line in lines[1:] if line.strip()]
+            text = data.decode(enc)
         except UnicodeDecodeError:
             continue
-        except FileNotFoundError:
-            raise FileNotFoundError(f"File not found: {filename}")
+        # Same universal-newline splitting as text-mode readlines(); unlike
+        # str.splitlines it does not break on \x0b, \x0c, \x85, \u2028 etc.
+        lines = io.StringIO(text, newline=None).readlines()
+        return [stripped for line in lines[1:] if (stripped := line.strip())]
 
-    raise UnicodeDecodeError("Unable to decode file with supported encodings")
+    raise UnicodeDecodeError(
+        encodings[-1], data, 0, len(data),
+        "Unable to decode file with supported encodings",
+    )
 